@@ -11,6 +11,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from data_collector import TreasuryDataCollector
+from analytics import calculate_spreads, identify_inversions
 import config
 
 # Configure Streamlit page
@@ -22,7 +23,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -57,7 +58,50 @@ st.markdown("""
         border-radius: 0.25rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CSS, unsafe_allow_html=True)
+
+# Maturities plotted on the yield curve, with their tenor in years
+MATURITIES = ['1M', '3M', '6M', '1Y', '2Y', '5Y', '10Y', '30Y']
+MAT_YEARS = pd.Series([1/12, 0.25, 0.5, 1, 2, 5, 10, 30], index=MATURITIES)
+
+def _frame_key(df):
+    """Cheap cache key for a yields DataFrame (avoids hashing every cell)"""
+    return (df.index[0], df.index[-1], len(df))
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False)
+def load_yields(_collector):
+    """Fetch Treasury yields from FRED, cached across reruns"""
+    # float32 halves memory and carries ~7 significant digits, plenty for display;
+    # it cannot store 2-decimal quotes exactly, so round any value used outside
+    # formatted output
+    return _collector.get_treasury_yields().astype(np.float32)
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def compute_metrics(_collector, yields_df):
+    """Yield curve metrics for the loaded data, cached across reruns"""
+    return _collector.calculate_yield_curve_metrics(yields_df)
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def compute_spreads(yields_df):
+    """Yield spread series for the loaded data, cached across reruns"""
+    return calculate_spreads(yields_df)
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def compute_inversions(spreads_df):
+    """Historical inversion periods for the loaded data, cached across reruns"""
+    return identify_inversions(spreads_df)
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def compute_recent_averages(yields_df):
+    """Trailing 30-day mean of the 10Y and 2Y yields, excluding the latest day"""
+    return yields_df[['10Y', '2Y']].iloc[-30:-1].mean()
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def compute_yield_range(yields_df, column='10Y'):
+    """Lowest and highest observed yield for a maturity"""
+    values = yields_df[column].to_numpy()
+    return float(np.nanmin(values)), float(np.nanmax(values))
 
 def create_yield_curve_chart(yields_df, compare_dates=None):
     """Create interactive yield curve chart"""
@@ -66,53 +110,41 @@ def create_yield_curve_chart(yields_df, compare_dates=None):
     
     fig = go.Figure()
     
-    maturities = ['1M', '3M', '6M', '1Y', '2Y', '5Y', '10Y', '30Y']
-    maturity_years = [1/12, 0.25, 0.5, 1, 2, 5, 10, 30]
-    
     # Current curve
     latest_date = yields_df.index[-1]
-    latest_yields = yields_df.iloc[-1]
+    latest_yields = yields_df.iloc[-1].reindex(MATURITIES).dropna()
     
-    current_x = []
-    current_y = []
+    current_x = MAT_YEARS.loc[latest_yields.index].values
+    current_y = latest_yields.values
     
-    for i, mat in enumerate(maturities):
-        if mat in latest_yields.index and pd.notna(latest_yields[mat]):
-            current_x.append(maturity_years[i])
-            current_y.append(latest_yields[mat])
-    
-    fig.add_trace(go.Scatter(
+    traces = [go.Scatter(
         x=current_x,
         y=current_y,
         mode='lines+markers',
         name=f'Current ({latest_date.strftime("%Y-%m-%d")})',
         line=dict(color='#1f77b4', width=3),
         marker=dict(size=8)
-    ))
+    )]
     
     # Add comparison curves if requested
     if compare_dates:
         colors = ['#ff7f0e', '#2ca02c', '#d62728']
         for i, date in enumerate(compare_dates):
             if date in yields_df.index:
-                compare_yields = yields_df.loc[date]
-                comp_x = []
-                comp_y = []
-                
-                for j, mat in enumerate(maturities):
-                    if mat in compare_yields.index and pd.notna(compare_yields[mat]):
-                        comp_x.append(maturity_years[j])
-                        comp_y.append(compare_yields[mat])
+                compare_yields = yields_df.loc[date].reindex(MATURITIES).dropna()
                 
-                fig.add_trace(go.Scatter(
-                    x=comp_x,
-                    y=comp_y,
+                traces.append(go.Scatter(
+                    x=MAT_YEARS.loc[compare_yields.index].values,
+                    y=compare_yields.values,
                     mode='lines+markers',
                     name=date.strftime("%Y-%m-%d"),
                     line=dict(color=colors[i % len(colors)], width=2),
                     marker=dict(size=6)
                 ))
     
+    # Add all curves in one batch so the figure is validated once
+    fig.add_traces(traces)
+    
     fig.update_layout(
         title="Treasury Yield Curve",
         xaxis_title="Maturity (Years)",
@@ -125,49 +157,52 @@ def create_yield_curve_chart(yields_df, compare_dates=None):
     
     return fig
 
-def create_spread_chart(yields_df):
+def create_spread_chart(spreads_df):
     """Create yield spread time series chart"""
-    if yields_df.empty:
+    if spreads_df.empty:
         return None
     
     fig = go.Figure()
+    traces = []
     
     # 2Y-10Y spread
-    if '2Y' in yields_df.columns and '10Y' in yields_df.columns:
-        spread_2y10y = yields_df['2Y'] - yields_df['10Y']
-        fig.add_trace(go.Scatter(
-            x=spread_2y10y.index,
-            y=spread_2y10y.values,
+    if '2Y-10Y' in spreads_df.columns:
+        traces.append(go.Scattergl(
+            x=spreads_df.index,
+            y=spreads_df['2Y-10Y'].values,
             name='2Y-10Y Spread',
             line=dict(color='#1f77b4', width=2)
         ))
     
     # 3M-10Y spread
-    if '3M' in yields_df.columns and '10Y' in yields_df.columns:
-        spread_3m10y = yields_df['3M'] - yields_df['10Y']
-        fig.add_trace(go.Scatter(
-            x=spread_3m10y.index,
-            y=spread_3m10y.values,
+    if '3M-10Y' in spreads_df.columns:
+        traces.append(go.Scattergl(
+            x=spreads_df.index,
+            y=spreads_df['3M-10Y'].values,
             name='3M-10Y Spread',
             line=dict(color='#ff7f0e', width=2)
         ))
     
-    # Add zero line
-    fig.add_hline(y=0, line_dash="dash", line_color="red")
-    
-    # Add recession shading
-    for start_str, end_str in config.RECESSION_PERIODS:
-        start_date = pd.to_datetime(start_str)
-        end_date = pd.to_datetime(end_str)
-        
-        if start_date >= yields_df.index[0]:
-            fig.add_vrect(
-                x0=start_date, x1=end_date,
-                fillcolor="gray", opacity=0.2,
-                line_width=0
-            )
+    fig.add_traces(traces)
+    
+    # Zero line plus recession shading, set as one shapes list
+    shapes = [dict(
+        type='line', xref='paper', yref='y',
+        x0=0, x1=1, y0=0, y1=0,
+        line=dict(color='red', dash='dash')
+    )]
+    shapes += [
+        dict(
+            type='rect', xref='x', yref='paper',
+            x0=start_date, x1=end_date, y0=0, y1=1,
+            fillcolor='gray', opacity=0.2, line_width=0
+        )
+        for start_date, end_date in config.RECESSION_PERIODS
+        if start_date >= spreads_df.index[0]
+    ]
     
     fig.update_layout(
+        shapes=shapes,
         title="Yield Curve Spreads with Recession Periods",
         xaxis_title="Date",
         yaxis_title="Spread (bps)",
@@ -178,6 +213,16 @@ def create_spread_chart(yields_df):
     
     return fig
 
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def build_yield_curve_chart(yields_df, compare_dates=()):
+    """Yield curve figure for the loaded data, cached across reruns"""
+    return create_yield_curve_chart(yields_df, list(compare_dates) or None)
+
+@st.cache_data(ttl=config.CACHE_TTL, show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def build_spread_chart(spreads_df):
+    """Spread figure for the loaded data, cached across reruns"""
+    return create_spread_chart(spreads_df)
+
 def main():
     # Header
     st.markdown(f'<div class="main-header">{config.APP_TITLE}</div>', unsafe_allow_html=True)
@@ -204,64 +249,66 @@ def main():
     
     # Load data
     with st.spinner("Loading Treasury data..."):
-        yields_df = collector.get_treasury_yields()
+        yields_df = load_yields(collector)
         
     if yields_df.empty:
         st.error("Failed to load yield data. Please check your connection and try again.")
         st.stop()
     
     # Calculate metrics
-    metrics = collector.calculate_yield_curve_metrics(yields_df)
-    inversions = collector.identify_inversions(yields_df)
+    metrics = compute_metrics(collector, yields_df)
+    spreads_df = compute_spreads(yields_df)
+    inversions = compute_inversions(spreads_df)
     
     # Current status
     st.subheader("📊 Current Market Status")
     
-    if not yields_df.empty:
-        latest_date = yields_df.index[-1]
-        latest_yields = yields_df.iloc[-1]
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                label="10Y Treasury",
-                value=f"{latest_yields.get('10Y', 0):.2f}%",
-                delta=f"{(latest_yields.get('10Y', 0) - yields_df['10Y'].iloc[-30:-1].mean()):.2f}% (30d avg)"
-            )
-        
-        with col2:
-            st.metric(
-                label="2Y Treasury", 
-                value=f"{latest_yields.get('2Y', 0):.2f}%",
-                delta=f"{(latest_yields.get('2Y', 0) - yields_df['2Y'].iloc[-30:-1].mean()):.2f}% (30d avg)"
-            )
-        
-        with col3:
-            spread_2y10y = latest_yields.get('2Y', 0) - latest_yields.get('10Y', 0)
-            st.metric(
-                label="2Y-10Y Spread",
-                value=f"{spread_2y10y:.0f} bps",
-                delta="Inverted" if spread_2y10y < 0 else "Normal"
-            )
-        
-        with col4:
-            curve_status = "🔴 Inverted" if spread_2y10y < 0 else "🟢 Normal"
-            st.metric(
-                label="Curve Status",
-                value=curve_status
-            )
+    latest_date = yields_df.index[-1]
+    latest_row = yields_df.iloc[-1]
+    last = {k: float(latest_row.get(k, 0.0)) for k in ('10Y', '2Y')}
+    avg30 = compute_recent_averages(yields_df)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            label="10Y Treasury",
+            value=f"{last['10Y']:.2f}%",
+            delta=f"{(last['10Y'] - avg30['10Y']):.2f}% (30d avg)"
+        )
+    
+    with col2:
+        st.metric(
+            label="2Y Treasury", 
+            value=f"{last['2Y']:.2f}%",
+            delta=f"{(last['2Y'] - avg30['2Y']):.2f}% (30d avg)"
+        )
+    
+    with col3:
+        spread_2y10y = last['2Y'] - last['10Y']
+        st.metric(
+            label="2Y-10Y Spread",
+            value=f"{spread_2y10y:.0f} bps",
+            delta="Inverted" if spread_2y10y < 0 else "Normal"
+        )
+    
+    with col4:
+        curve_status = "🔴 Inverted" if spread_2y10y < 0 else "🟢 Normal"
+        st.metric(
+            label="Curve Status",
+            value=curve_status
+        )
     
     # Main charts
     st.subheader("📈 Yield Curve Analysis")
     
     # Yield curve chart
-    curve_chart = create_yield_curve_chart(yields_df)
+    curve_chart = build_yield_curve_chart(yields_df)
     if curve_chart:
         st.plotly_chart(curve_chart, use_container_width=True)
     
     # Spread chart
-    spread_chart = create_spread_chart(yields_df)
+    spread_chart = build_spread_chart(spreads_df)
     if spread_chart:
         st.plotly_chart(spread_chart, use_container_width=True)
     
@@ -282,12 +329,12 @@ def main():
     
     with col2:
         st.write("**Key Statistics:**")
-        if not yields_df.empty:
-            st.write(f"• Data period: {yields_df.index[0].strftime('%Y-%m-%d')} to {yields_df.index[-1].strftime('%Y-%m-%d')}")
-            st.write(f"• Total observations: {len(yields_df):,}")
-            if '10Y' in yields_df.columns:
-                st.write(f"• 10Y yield range: {yields_df['10Y'].min():.2f}% - {yields_df['10Y'].max():.2f}%")
-            st.write(f"• Historical inversions: {len(inversions)}")
+        st.write(f"• Data period: {yields_df.index[0].strftime('%Y-%m-%d')} to {yields_df.index[-1].strftime('%Y-%m-%d')}")
+        st.write(f"• Total observations: {len(yields_df):,}")
+        if '10Y' in yields_df.columns:
+            lo, hi = compute_yield_range(yields_df, '10Y')
+            st.write(f"• 10Y yield range: {lo:.2f}% - {hi:.2f}%")
+        st.write(f"• Historical inversions: {len(inversions)}")
     
     # Footer
     st.markdown("---")
@@ -1 +1,40 @@
 
+import numpy as np
+import pandas as pd
+import config
+
+def calculate_spreads(yields_df):
+    """Compute each configured yield spread available in the data"""
+    return pd.DataFrame({
+        name: yields_df[short] - yields_df[long]
+        for name, (short, long) in config.SPREAD_PAIRS.items()
+        if short in yields_df.columns and long in yields_df.columns
+    }, index=yields_df.index)
+
+def identify_inversions(spreads_df):
+    """Find periods where the 2Y yield exceeds the 10Y yield"""
+    if '2Y-10Y' not in spreads_df.columns:
+        return []
+    
+    # Drop missing observations (e.g. market holidays) so they don't split runs
+    observed = spreads_df['2Y-10Y'].dropna()
+    spread = observed.to_numpy()
+    inverted = spread > config.INVERSION_THRESHOLD
+    
+    # Run boundaries: +1 where an inversion starts, -1 one past where it ends
+    edges = np.diff(np.r_[0, inverted.view(np.int8), 0])
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    durations = ends - starts
+    keep = durations >= config.MIN_INVERSION_DAYS
+    
+    # Yields are float32, so round to drop representation noise (7 bps, not 6.99999)
+    return [
+        {
+            'start': observed.index[start],
+            'end': observed.index[end - 1],
+            'duration_days': int(duration),
+            'max_inversion': round(float(spread[start:end].max()) * 100, 2)
+        }
+        for start, end, duration in zip(starts[keep], ends[keep], durations[keep])
+    ]
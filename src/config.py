@@ -1,5 +1,6 @@
 
 import os
+import pandas as pd
 import streamlit as st
 
 # FRED API Configuration - Uses Streamlit secrets in cloud
@@ -24,6 +25,12 @@ TREASURY_SERIES = {
     '30Y': 'DGS30'
 }
 
+# Yield spreads tracked (short maturity minus long maturity)
+SPREAD_PAIRS = {
+    '2Y-10Y': ('2Y', '10Y'),
+    '3M-10Y': ('3M', '10Y')
+}
+
 # Economic indicators
 ECONOMIC_INDICATORS = {
     'GDP': 'GDP',
@@ -34,7 +41,7 @@ ECONOMIC_INDICATORS = {
 }
 
 # NBER Recession periods (updated through 2023)
-RECESSION_PERIODS = [
+RECESSION_PERIODS = [(pd.Timestamp(start), pd.Timestamp(end)) for start, end in [
     ('1969-12-01', '1970-11-01'),
     ('1973-11-01', '1975-03-01'),
     ('1980-01-01', '1980-07-01'),
@@ -43,7 +50,7 @@ RECESSION_PERIODS = [
     ('2001-03-01', '2001-11-01'),
     ('2007-12-01', '2009-06-01'),
     ('2020-02-01', '2020-04-01')
-]
+]]
 
 # Analysis parameters
 LOOKBACK_YEARS = 10